@@ -22,6 +22,12 @@ import {
 } from "lucide-react";
 import type { ListItem } from "@shared/schema";
 
+declare global {
+  interface Window {
+    __resetTestState?: () => Promise<void>;
+  }
+}
+
 export default function Home() {
   const [isDarkMode, setIsDarkMode] = useState(false);
   const [dynamicLoaded, setDynamicLoaded] = useState(false);
@@ -36,6 +42,10 @@ export default function Home() {
   const scrollContainerRef = useRef<HTMLDivElement>(null);
   const pageRef = useRef(1);
   const isLoadingRef = useRef(false);
+  const dynamicTimerRef = useRef<number | null>(null);
+  const loadGenerationRef = useRef(0);
+  const resetResolveRef = useRef<(() => void) | null>(null);
+  const [resetCount, setResetCount] = useState(0);
 
   useEffect(() => {
     if (isDarkMode) {
@@ -55,21 +65,76 @@ export default function Home() {
     setIsLoadingMore(true);
     
     const currentPage = pageRef.current;
+    // A test-state reset bumps the generation; results of a fetch that was
+    // in flight at that moment must not leak into the fresh list.
+    const generation = loadGenerationRef.current;
     
     try {
       const response = await fetch(`/api/items?page=${currentPage}&limit=10`);
       const data = await response.json();
       
+      if (generation !== loadGenerationRef.current) return;
       setItems(prev => [...prev, ...data.items]);
       pageRef.current = currentPage + 1;
     } catch (error) {
       console.error("Failed to load items:", error);
     } finally {
+      if (generation === loadGenerationRef.current) {
+        isLoadingRef.current = false;
+        setIsLoadingMore(false);
+      }
+    }
+  }, []);
+
+  useEffect(() => {
+    // Lets a Selenium session that reuses this page restore the initial
+    // state between tests instead of paying for a full reload. The returned
+    // promise resolves once the reset has rendered and the first page of
+    // items has been fetched again.
+    window.__resetTestState = () => new Promise<void>((resolve) => {
+      if (dynamicTimerRef.current !== null) {
+        window.clearTimeout(dynamicTimerRef.current);
+        dynamicTimerRef.current = null;
+      }
+      loadGenerationRef.current += 1;
       isLoadingRef.current = false;
+      setDynamicLoaded(false);
+      setIsLoading(false);
+      setUsername("");
+      setPassword("");
+      setLoginResult(null);
+      setHoverMenuVisible(false);
+      setSelectedMenuItem(null);
+      setItems([]);
       setIsLoadingMore(false);
-    }
+      pageRef.current = 1;
+      if (scrollContainerRef.current) {
+        scrollContainerRef.current.scrollTop = 0;
+      }
+      resetResolveRef.current = resolve;
+      setResetCount(count => count + 1);
+    });
+    return () => {
+      delete window.__resetTestState;
+    };
   }, []);
 
+  useEffect(() => {
+    // Runs after the reset render has committed
+    if (resetCount > 0) {
+      loadMoreItems();
+    }
+  }, [resetCount, loadMoreItems]);
+
+  useEffect(() => {
+    // The refetch started above has finished and its items are rendered
+    if (!isLoadingMore && !isLoadingRef.current && resetResolveRef.current) {
+      const resolve = resetResolveRef.current;
+      resetResolveRef.current = null;
+      resolve();
+    }
+  }, [isLoadingMore, resetCount]);
+
   const handleScroll = useCallback((e: React.UIEvent<HTMLDivElement>) => {
     const { scrollTop, scrollHeight, clientHeight } = e.currentTarget;
     if (scrollHeight - scrollTop <= clientHeight + 100 && !isLoadingRef.current) {
@@ -80,7 +145,8 @@ export default function Home() {
   const handleLoadDynamicElements = () => {
     setIsLoading(true);
     setDynamicLoaded(false);
-    setTimeout(() => {
+    dynamicTimerRef.current = window.setTimeout(() => {
+      dynamicTimerRef.current = null;
       setDynamicLoaded(true);
       setIsLoading(false);
     }, 2000);
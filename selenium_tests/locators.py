@@ -0,0 +1,78 @@
+"""
+Shared locators for the Selenium Practice Lab test scripts.
+
+Every selector used by test_selenium_practice.py and test_selenium_case2.py
+is defined here once, so both scripts stay in sync with the app's
+data-testid attributes. All locators are CSS selectors, which also lets
+grab() and grab_text() resolve several of them in one execute_script call.
+"""
+
+from selenium.webdriver.common.by import By
+
+# Dynamic element loading
+BTN_LOAD = (By.CSS_SELECTOR, "[data-testid='button-load-elements']")
+INPUT_DYNAMIC = (By.CSS_SELECTOR, "[data-testid='input-dynamic']")
+BTN_DYNAMIC_ACTION = (By.CSS_SELECTOR, "[data-testid='button-dynamic-action']")
+TEXT_DYNAMIC_MESSAGE = (By.CSS_SELECTOR, "[data-testid='text-dynamic-message']")
+
+# State-controlled login form
+INPUT_USERNAME = (By.CSS_SELECTOR, "[data-testid='input-username']")
+INPUT_PASSWORD = (By.CSS_SELECTOR, "[data-testid='input-password']")
+TEXT_USERNAME_STATE = (By.CSS_SELECTOR, "[data-testid='text-username-state']")
+TEXT_PASSWORD_STATE = (By.CSS_SELECTOR, "[data-testid='text-password-state']")
+BTN_LOGIN = (By.CSS_SELECTOR, "[data-testid='button-login']")
+TEXT_LOGIN_RESULT = (By.CSS_SELECTOR, "[data-testid='text-login-result']")
+CARD_STATE_FORM = (By.CSS_SELECTOR, "[data-testid='card-state-controlled-form']")
+
+# Hover dropdown menu
+BTN_HOVER_TRIGGER = (By.CSS_SELECTOR, "[data-testid='button-hover-trigger']")
+MENU_ITEM_SECOND = (By.CSS_SELECTOR, "[data-testid='menu-item-1']")
+TEXT_SELECTED_MENU_ITEM = (By.CSS_SELECTOR, "[data-testid='text-selected-menu-item']")
+
+# Alerts
+BTN_SIMPLE_ALERT = (By.CSS_SELECTOR, "[data-testid='button-simple-alert']")
+BTN_DELETE = (By.CSS_SELECTOR, "[data-testid='button-delete']")
+
+# Infinite scroll
+CONTAINER_SCROLL_LIST = (By.CSS_SELECTOR, "[data-testid='container-scroll-list']")
+BADGE_ITEM_COUNT = (By.CSS_SELECTOR, "[data-testid='badge-item-count']")
+
+# Selector strategies
+SELECTOR_ELEMENT_1 = (By.CSS_SELECTOR, "[data-testid='selector-element-1']")
+SELECTOR_BUTTON = (By.CSS_SELECTOR, "[data-testid='selector-button']")
+
+
+def grab(driver, locators: list) -> list:
+    """
+    Look up several elements in a single WebDriver round-trip.
+
+    Args:
+        driver: WebDriver to run the lookup in
+        locators: (By.CSS_SELECTOR, selector) tuples to resolve with
+            document.querySelector
+
+    Returns:
+        Elements in the same order as the locators (None if not found)
+    """
+    return driver.execute_script(
+        "return arguments[0].map(s => document.querySelector(s))",
+        [selector for _, selector in locators]
+    )
+
+
+def grab_text(driver, locators: list) -> list:
+    """
+    Read the textContent of several elements in a single round-trip.
+
+    Args:
+        driver: WebDriver to run the lookup in
+        locators: (By.CSS_SELECTOR, selector) tuples to resolve with
+            document.querySelector
+
+    Returns:
+        Text of each element in the same order as the locators
+    """
+    return driver.execute_script(
+        "return arguments[0].map(s => document.querySelector(s).textContent)",
+        [selector for _, selector in locators]
+    )
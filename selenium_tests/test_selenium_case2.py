@@ -1,11 +1,13 @@
  
 
-import time
 import os
+import shutil
+import tempfile
 import logging
 from datetime import datetime
 from typing import Optional
 
+import pytest
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -22,11 +24,81 @@ from selenium.common.exceptions import (
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 
+from locators import (
+    BTN_LOAD,
+    INPUT_DYNAMIC,
+    BTN_DYNAMIC_ACTION,
+    TEXT_DYNAMIC_MESSAGE,
+    INPUT_USERNAME,
+    INPUT_PASSWORD,
+    BTN_LOGIN,
+    TEXT_USERNAME_STATE,
+    TEXT_PASSWORD_STATE,
+    TEXT_LOGIN_RESULT,
+    grab,
+    grab_text,
+)
+
 logging.basicConfig(
-    level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+# Level the module logger rather than the root: both test modules run in
+# one pytest process and only the first basicConfig() call takes effect.
+logger.setLevel(os.environ.get("LOG_LEVEL", "WARNING").upper())
+
+# Keep the Chrome profile on a ramdisk so profile writes skip the disk
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+_SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+_PROFILE_DIR = os.path.join(_SHM_DIR, f"chrome-{_WORKER}-{os.getpid()}")
+
+# Chrome options are invariant for the whole run, so build them once at import
+_CHROME_OPTS = Options()
+for _arg in (
+    f"--user-data-dir={_PROFILE_DIR}",
+    "--window-size=1280,720",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-notifications",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--blink-settings=imagesEnabled=false",
+):
+    _CHROME_OPTS.add_argument(_arg)
+if os.environ.get("HEADLESS", "1") == "1":
+    _CHROME_OPTS.add_argument("--headless=new")
+# Return from driver.get() at DOMContentLoaded; explicit waits cover the rest.
+_CHROME_OPTS.page_load_strategy = "eager"
+
+
+@pytest.fixture(scope="session")
+def shared_driver():
+    """
+    Launch a single Chrome instance reused by every test in the session.
+    
+    Uses the module-level _CHROME_OPTS, which configure:
+    - Profile directory on /dev/shm (falls back to the temp dir)
+    - Headless mode (default, disable with HEADLESS=0)
+    - Window size
+    - Images, extensions and background networking disabled
+    - Eager page load strategy
+    
+    The implicit wait is disabled (explicit waits only).
+    """
+    driver = webdriver.Chrome(options=_CHROME_OPTS)
+    
+    # Implicit and explicit waits must not overlap: with both set, every
+    # find_element inside an expected_condition polls for the implicit timeout.
+    driver.implicitly_wait(0)
+    
+    logger.info("WebDriver initialized successfully")
+    yield driver
+    
+    driver.quit()
+    shutil.rmtree(_PROFILE_DIR, ignore_errors=True)
+    logger.info("WebDriver closed")
 
 
 class TestSeleniumPractice:
@@ -36,45 +108,107 @@ class TestSeleniumPractice:
     This class contains all test methods for practicing Selenium automation
     with a React-based frontend application.
     
-    Run with pytest:
-        pytest test_selenium_practice.py -v
+    Run with pytest (parallel, one Chrome per xdist worker):
+        pytest -n auto selenium_tests/ -v
     """
     
     base_url = os.environ.get("BASE_URL", "https://react-selenium-automation.replit.app/")
     driver: Optional[webdriver.Chrome] = None
     wait: Optional[WebDriverWait] = None
-    screenshots_dir = "screenshots"
+    screenshots_dir = f"screenshots_{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}"
+    save_screenshots = os.environ.get("SAVE_SCREENSHOTS", "0") == "1"
     
-    def setup_method(self) -> None:
+    @pytest.fixture(autouse=True)
+    def _reset(self, shared_driver: webdriver.Chrome):
         """
-        Set up the WebDriver with appropriate options.
+        Attach the shared WebDriver to this test and reset browser state.
+        
+        Cookies are cleared and the app is brought back to its initial state
+        so every test starts from a clean slate without paying for a new
+        Chrome launch. When the app is already loaded, its state is reset
+        in place through window.__resetTestState instead of reloading; the
+        hook's promise is awaited so the next test never sees stale DOM.
         
-        Configures Chrome WebDriver with:
-        - Headless mode (optional)
-        - Window size
-        - Implicit wait (global)
+        After the test, any screenshot captured on failure is flushed.
         """
-        os.makedirs(self.screenshots_dir, exist_ok=True)
+        self._pending_png: Optional[bytes] = None
+        self._pending_path: Optional[str] = None
+        
+        self.driver = shared_driver
+        self.wait = WebDriverWait(self.driver, 10, poll_frequency=0.1)
+        
+        self.driver.delete_all_cookies()
+        if not self.driver.current_url.startswith(self.base_url):
+            self.driver.get(self.base_url)
+        elif not self.driver.execute_async_script("""
+            var done = arguments[arguments.length - 1];
+            if (!window.__resetTestState) {
+                done(false);
+                return;
+            }
+            window.__resetTestState().then(function () { done(true); });
+        """):
+            self.driver.refresh()
         
-        chrome_options = Options()
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
+        yield
         
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.flush_screenshot()
+    
+    def save_screenshot(self, name: str) -> Optional[str]:
+        """
+        Capture a screenshot with timestamp and keep it in memory.
+        
+        Nothing is captured unless SAVE_SCREENSHOTS=1; the PNG is written
+        to disk by flush_screenshot() once the test has finished.
         
-        self.driver.implicitly_wait(5)
+        Args:
+            name: Base name for the screenshot
+            
+        Returns:
+            Path the screenshot will be saved to, or None if capture is
+            disabled
+        """
+        if not self.save_screenshots:
+            return None
         
-        self.wait = WebDriverWait(self.driver, 10)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{name}_{timestamp}.png"
+        self._pending_path = os.path.join(self.screenshots_dir, filename)
+        self._pending_png = self.driver.get_screenshot_as_png()
+        return self._pending_path
+    
+    def flush_screenshot(self) -> None:
+        """Write the pending failure screenshot to disk, if enabled."""
+        if self._pending_png is None:
+            return
         
-        logger.info("WebDriver initialized successfully")
+        os.makedirs(self.screenshots_dir, exist_ok=True)
+        with open(self._pending_path, "wb") as f:
+            f.write(self._pending_png)
+        logger.info("Screenshot saved: %s", self._pending_path)
+        self._pending_png = None
     
-    def teardown_method(self) -> None:
-        """Clean up resources and close the browser."""
-        if self.driver:
-            self.driver.quit()
-            logger.info("WebDriver closed")
+    def react_set(self, locator: tuple, value: str) -> None:
+        """
+        Set the value of a React controlled input in one WebDriver call.
+        
+        Assigning .value directly is swallowed by React, so the native
+        HTMLInputElement setter is used and a bubbling input event is
+        dispatched to fire onChange once, instead of one key event per
+        character as with send_keys().
+        
+        Args:
+            locator: (By.CSS_SELECTOR, selector) tuple of the input element
+            value: Value to set
+        """
+        self.driver.execute_script("""
+            var input = document.querySelector(arguments[0]);
+            var nativeInputValueSetter = Object.getOwnPropertyDescriptor(
+                window.HTMLInputElement.prototype, 'value'
+            ).set;
+            nativeInputValueSetter.call(input, arguments[1]);
+            input.dispatchEvent(new Event('input', { bubbles: true }));
+        """, locator[1], value)
     
     def test_dynamic_element_loading(self) -> bool:
         """
@@ -93,43 +227,46 @@ class TestSeleniumPractice:
         logger.info("=" * 50)
         
         try:
-            self.driver.get(self.base_url)
-            
             load_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-testid='button-load-elements']"))
+                EC.element_to_be_clickable(BTN_LOAD)
             )
             logger.info("Found load button using data-testid selector")
             
             load_button.click()
             logger.info("Clicked load button - waiting 2 seconds for dynamic elements...")
             
-            dynamic_input = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='input-dynamic']"))
+            WebDriverWait(self.driver, 5, poll_frequency=0.1).until(
+                lambda d: d.execute_script(
+                    "return !!document.querySelector(arguments[0])", INPUT_DYNAMIC[1]
+                )
             )
             logger.info("Dynamic input appeared!")
             
-            dynamic_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-testid='button-dynamic-action']"))
-            )
+            # The dynamic elements mount together, so fetch all handles at once
+            dynamic_input, dynamic_button, dynamic_message = grab(self.driver, [
+                INPUT_DYNAMIC,
+                BTN_DYNAMIC_ACTION,
+                TEXT_DYNAMIC_MESSAGE,
+            ])
+            # The container fades in from opacity 0, and .text only returns
+            # visible text, so wait on the handles already fetched above.
+            self.wait.until(EC.element_to_be_clickable(dynamic_button))
             logger.info("Dynamic button is clickable!")
             
-            dynamic_message = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='text-dynamic-message']"
-            )
-            assert "successfully" in dynamic_message.text.lower()
-            logger.info(f"Success message verified: {dynamic_message.text}")
+            self.wait.until(EC.visibility_of(dynamic_message))
+            message_text = dynamic_message.text
+            assert "successfully" in message_text.lower()
+            logger.info("Success message verified: %s", message_text)
             
             logger.info("TEST PASSED: Dynamic Element Loading")
             # return True
             
-            target_input = self.wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, '[data-element-type="delayed-input"]')))
+            target_input = self.wait.until(EC.visibility_of(dynamic_input))
             target_input.clear()
             target_input.send_keys("피카츄")
-                
-            time.sleep(3)
             
         except Exception as e:
-            logger.error(f"TEST FAILED: {str(e)}")
+            logger.error("TEST FAILED: %s", e)
             self.save_screenshot("test_dynamic_loading_failed")
             return False
     
@@ -138,12 +275,13 @@ class TestSeleniumPractice:
         Test 2: React State-Controlled Input Handling
         
         This test demonstrates:
-        - send_keys() for React controlled inputs
+        - Native value setter + input event for React controlled inputs
         - Verifying React state updates
         - Form submission
         
         Important: Direct DOM value manipulation won't work with React!
-        You must use send_keys() to trigger onChange events.
+        You must trigger onChange, either via send_keys() or by dispatching
+        an input event after the native value setter (see react_set()).
         
         Returns:
             bool: True if test passes, False otherwise
@@ -153,61 +291,51 @@ class TestSeleniumPractice:
         logger.info("=" * 50)
         
         try:
-            self.driver.get(self.base_url)
-            
-            username_input = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='input-username']"))
-            )
-            
-            password_input = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='input-password']"
+            self.wait.until(
+                EC.presence_of_element_located(INPUT_USERNAME)
             )
             
             test_username = "selenium_user"
             test_password = "secure_password_123"
             
-            username_input.clear()
-            username_input.send_keys(test_username)
-            logger.info(f"Entered username: {test_username}")
+            self.react_set(INPUT_USERNAME, test_username)
+            logger.info("Entered username: %s", test_username)
             
-            password_input.clear()
-            password_input.send_keys(test_password)
+            self.react_set(INPUT_PASSWORD, test_password)
             logger.info("Entered password")
             
-            username_state = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='text-username-state']"
-            )
-            assert test_username in username_state.text
-            logger.info(f"State verification: Username state shows '{username_state.text}'")
+            login_button = self.driver.find_element(*BTN_LOGIN)
+            login_button.click()
+            logger.info("Clicked login button")
             
-            password_state = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='text-password-state']"
+            self.wait.until(
+                EC.presence_of_element_located(TEXT_LOGIN_RESULT)
             )
+            username_text, password_text, result_text = grab_text(self.driver, [
+                TEXT_USERNAME_STATE,
+                TEXT_PASSWORD_STATE,
+                TEXT_LOGIN_RESULT,
+            ])
+            
+            assert test_username in username_text
+            logger.info("State verification: Username state shows '%s'", username_text)
+            
             expected_masked = "*" * len(test_password)
-            assert expected_masked in password_state.text
+            assert expected_masked in password_text
             logger.info("State verification: Password state shows masked value")
             
-            login_button = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='button-login']"
-            )
-            login_button.click()
-            logger.info("Clicked login button")
-            
-            result_element = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='text-login-result']"))
-            )
-            assert "successful" in result_element.text.lower()
-            logger.info(f"Login result: {result_element.text}")
+            assert "successful" in result_text.lower()
+            logger.info("Login result: %s", result_text)
             
             logger.info("TEST PASSED: State-Controlled Inputs")
             # return True
-            time.sleep(3)
             
         except Exception as e:
-            logger.error(f"TEST FAILED: {str(e)}")
+            logger.error("TEST FAILED: %s", e)
             self.save_screenshot("test_state_inputs_failed")
             return False
     
 
 if __name__ == "__main__":
-    exit(main())
+    import sys
+    sys.exit(pytest.main([__file__, "-v", "-n", "auto"]))
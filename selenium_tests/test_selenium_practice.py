@@ -7,11 +7,10 @@ various automation techniques with a React-based frontend.
 
 Requirements:
 - Python 3.8+
-- selenium
-- webdriver-manager (optional, for automatic driver management)
+- selenium>=4.6 (bundles Selenium Manager for automatic driver management)
 
 Installation:
-    pip install selenium webdriver-manager
+    pip install selenium
 
 Usage:
     python test_selenium_practice.py
@@ -26,11 +25,11 @@ Features Covered:
 - Screenshot capture on failure
 """
 
-import time
 import os
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -43,17 +42,43 @@ from selenium.common.exceptions import (
     NoSuchElementException,
     ElementClickInterceptedException,
     StaleElementReferenceException,
-    UnexpectedAlertPresentException
+    UnexpectedAlertPresentException,
+    NoAlertPresentException
 )
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 
+from locators import (
+    BTN_LOAD,
+    INPUT_DYNAMIC,
+    BTN_DYNAMIC_ACTION,
+    TEXT_DYNAMIC_MESSAGE,
+    INPUT_USERNAME,
+    INPUT_PASSWORD,
+    TEXT_USERNAME_STATE,
+    TEXT_PASSWORD_STATE,
+    BTN_LOGIN,
+    TEXT_LOGIN_RESULT,
+    CARD_STATE_FORM,
+    BTN_HOVER_TRIGGER,
+    MENU_ITEM_SECOND,
+    TEXT_SELECTED_MENU_ITEM,
+    BTN_SIMPLE_ALERT,
+    BTN_DELETE,
+    CONTAINER_SCROLL_LIST,
+    BADGE_ITEM_COUNT,
+    SELECTOR_ELEMENT_1,
+    SELECTOR_BUTTON,
+    grab,
+)
+
 logging.basicConfig(
-    level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
-
+# Level the module logger rather than the root: both test modules run in
+# one pytest process and only the first basicConfig() call takes effect.
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
 
 class TestSeleniumPractice:
     """
@@ -62,63 +87,204 @@ class TestSeleniumPractice:
     This class contains all test methods for practicing Selenium automation
     with a React-based frontend application.
     
-    Run with pytest:
-        pytest test_selenium_practice.py -v
+    Run with pytest (parallel, one Chrome per xdist worker):
+        pytest -n auto selenium_tests/test_selenium_practice.py -v
     """
     
     base_url = os.environ.get("BASE_URL", "http://localhost:5000")
     driver: Optional[webdriver.Chrome] = None
     wait: Optional[WebDriverWait] = None
-    screenshots_dir = "screenshots"
+    slow_wait: Optional[WebDriverWait] = None
+    implicit_wait = 0
+    screenshots_dir = f"screenshots_{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}"
+    screenshot_writer: Optional[ThreadPoolExecutor] = None
+    screenshot_futures: List[Future] = []
     
-    def setup_method(self) -> None:
+    @classmethod
+    def setup_class(cls) -> None:
         """
-        Set up the WebDriver with appropriate options.
+        Set up the WebDriver once for the whole class.
         
         Configures Chrome WebDriver with:
-        - Headless mode (optional)
-        - Window size
-        - Implicit wait (global)
+        - Headless mode (default, disable with HEADLESS=0)
+        - Window size (1366x768 headless, 1920x1080 otherwise)
+        - Extensions, sync, audio and background networking disabled
+        - Images blocked (disable with BLOCK_IMAGES=0)
+        - Eager page load strategy
+        - Implicit wait disabled (explicit waits only)
         """
-        os.makedirs(self.screenshots_dir, exist_ok=True)
+        os.makedirs(cls.screenshots_dir, exist_ok=True)
+        
+        # Failure screenshots are written to disk off the test thread
+        cls.screenshot_writer = ThreadPoolExecutor(max_workers=1)
+        cls.screenshot_futures = []
+        
+        headless = os.environ.get("HEADLESS", "1") == "1"
         
         chrome_options = Options()
-        chrome_options.add_argument("--window-size=1920,1080")
+        if headless:
+            # Nobody looks at a headless window; fewer pixels keep captures cheap
+            chrome_options.add_argument("--window-size=1366,768")
+        else:
+            chrome_options.add_argument("--window-size=1920,1080")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--mute-audio")
+        if os.environ.get("BLOCK_IMAGES", "1") == "1":
+            # None of the tests assert on graphics; skip fetching images
+            chrome_options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+        if headless:
+            chrome_options.add_argument("--headless=new")
+        # Return from driver.get() at DOMContentLoaded; every test waits
+        # explicitly for the elements it needs.
+        chrome_options.page_load_strategy = "eager"
+        
+        cls.driver = webdriver.Chrome(options=chrome_options)
+        
+        # No implicit wait: combined with WebDriverWait it is paid again on
+        # every poll of an element that is not there yet.
+        cls.driver.implicitly_wait(cls.implicit_wait)
+        # Async scripts (infinite scroll) get the same 10s budget as the
+        # explicit waits; set once since the driver lives for the class.
+        cls.driver.set_script_timeout(10)
+        
+        # Short poll for React state transitions that settle well under
+        # 500ms: faster early exit at the cost of more HTTP polls.
+        cls.wait = WebDriverWait(cls.driver, 10, poll_frequency=0.1)
+        # Default 500ms poll for alerts, where reacting a bit later is fine
+        # and fewer polls keep ChromeDriver traffic down.
+        cls.slow_wait = WebDriverWait(cls.driver, 10, poll_frequency=0.5)
         
-        self.driver = webdriver.Chrome(options=chrome_options)
+        logger.info("WebDriver initialized successfully")
+    
+    @classmethod
+    def teardown_class(cls) -> None:
+        """Clean up resources and close the browser."""
+        try:
+            if cls.screenshot_writer:
+                cls.screenshot_writer.shutdown(wait=True)
+                cls.screenshot_writer = None
+            # Surface write errors that happened on the writer thread
+            for future in cls.screenshot_futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Failed to save screenshot: {str(e)}")
+            cls.screenshot_futures = []
+        finally:
+            if cls.driver:
+                cls.driver.quit()
+                cls.driver = None
+                logger.info("WebDriver closed")
+    
+    def setup_method(self) -> None:
+        """Reset browser state between tests while reusing the same browser."""
+        self.driver.delete_all_cookies()
+        self.driver.get(self.base_url)
+    
+    def _find_now(self, locator: tuple):
+        """
+        Find an element on a page already known to be ready.
         
-        self.driver.implicitly_wait(5)
+        Fails immediately instead of paying the implicit wait on a typo or
+        flaky selector. The implicit wait is only toggled (and restored in
+        finally) when one is configured, so the default costs no extra calls.
         
-        self.wait = WebDriverWait(self.driver, 10)
+        Args:
+            locator: (By, value) tuple of the element
+            
+        Returns:
+            The matching WebElement
+        """
+        if not self.implicit_wait:
+            return self.driver.find_element(*locator)
         
-        logger.info("WebDriver initialized successfully")
+        self.driver.implicitly_wait(0)
+        try:
+            return self.driver.find_element(*locator)
+        finally:
+            self.driver.implicitly_wait(self.implicit_wait)
     
-    def teardown_method(self) -> None:
-        """Clean up resources and close the browser."""
-        if self.driver:
-            self.driver.quit()
-            logger.info("WebDriver closed")
+    def _insert_text(self, text: str, element=None) -> None:
+        """
+        Type a whole string into the focused input with one CDP message.
+        
+        send_keys() sends one WebDriver command per character; Chrome's
+        Input.insertText inserts the string at once and still fires a real
+        input event, so React's onChange runs.
+        
+        Args:
+            text: Text to insert
+            element: Element to focus first (defaults to the active element)
+        """
+        if element is not None:
+            element.click()
+        self.driver.execute_cdp_cmd("Input.insertText", {"text": text})
     
-    def save_screenshot(self, name: str) -> str:
+    def _write_screenshot(self, name: str, png: bytes) -> str:
         """
-        Save a screenshot with timestamp.
+        Queue PNG bytes to be written to the screenshots directory.
         
         Args:
             name: Base name for the screenshot
+            png: Encoded PNG data
             
         Returns:
-            Path to the saved screenshot
+            Path the screenshot is written to
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{name}_{timestamp}.png"
         filepath = os.path.join(self.screenshots_dir, filename)
-        self.driver.save_screenshot(filepath)
-        logger.info(f"Screenshot saved: {filepath}")
+        
+        def write() -> None:
+            with open(filepath, "wb") as f:
+                f.write(png)
+            logger.info(f"Screenshot saved: {filepath}")
+        
+        if self.screenshot_writer:
+            self.screenshot_futures.append(self.screenshot_writer.submit(write))
+        else:
+            write()
         return filepath
     
+    def save_screenshot(self, name: str) -> str:
+        """
+        Save a full-window screenshot with timestamp.
+        
+        Only the capture blocks the test; the file write happens on
+        the screenshot writer thread.
+        
+        Args:
+            name: Base name for the screenshot
+            
+        Returns:
+            Path to the saved screenshot
+        """
+        return self._write_screenshot(name, self.driver.get_screenshot_as_png())
+    
+    def save_element_screenshot(self, element, name: str) -> str:
+        """
+        Save a screenshot of a single element with timestamp.
+        
+        Used instead of save_screenshot() when the failing element is
+        known: cropping to the element encodes a much smaller PNG.
+        
+        Args:
+            element: WebElement to capture
+            name: Base name for the screenshot
+            
+        Returns:
+            Path to the saved screenshot
+        """
+        return self._write_screenshot(name, element.screenshot_as_png)
+    
     def test_dynamic_element_loading(self) -> bool:
         """
         Test 1: Dynamic Element Loading with Explicit Wait
@@ -136,35 +302,34 @@ class TestSeleniumPractice:
         logger.info("=" * 50)
         
         try:
-            self.driver.get(self.base_url)
-            
             load_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-testid='button-load-elements']"))
+                EC.element_to_be_clickable(BTN_LOAD)
             )
             logger.info("Found load button using data-testid selector")
             
             load_button.click()
             logger.info("Clicked load button - waiting 2 seconds for dynamic elements...")
             
-            dynamic_input = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='input-dynamic']"))
-            )
-            logger.info("Dynamic input appeared!")
-            
-            dynamic_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-testid='button-dynamic-action']"))
+            # One compound wait: all three conditions are checked in each poll
+            dynamic_input, dynamic_button, dynamic_message = self.wait.until(
+                EC.all_of(
+                    EC.presence_of_element_located(INPUT_DYNAMIC),
+                    EC.element_to_be_clickable(BTN_DYNAMIC_ACTION),
+                    EC.presence_of_element_located(TEXT_DYNAMIC_MESSAGE),
+                )
             )
-            logger.info("Dynamic button is clickable!")
+            logger.info("Dynamic input appeared and dynamic button is clickable!")
             
-            dynamic_message = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='text-dynamic-message']"
-            )
             assert "successfully" in dynamic_message.text.lower()
             logger.info(f"Success message verified: {dynamic_message.text}")
             
             logger.info("TEST PASSED: Dynamic Element Loading")
             return True
             
+        except AssertionError as e:
+            logger.error(f"TEST FAILED: {str(e)}")
+            self.save_element_screenshot(dynamic_message, "test_dynamic_loading_failed")
+            return False
         except Exception as e:
             logger.error(f"TEST FAILED: {str(e)}")
             self.save_screenshot("test_dynamic_loading_failed")
@@ -175,12 +340,13 @@ class TestSeleniumPractice:
         Test 2: React State-Controlled Input Handling
         
         This test demonstrates:
-        - send_keys() for React controlled inputs
+        - CDP Input.insertText for React controlled inputs
         - Verifying React state updates
         - Form submission
         
         Important: Direct DOM value manipulation won't work with React!
-        You must use send_keys() to trigger onChange events.
+        You must trigger onChange with real input events, e.g. send_keys()
+        or Input.insertText (see _insert_text()).
         
         Returns:
             bool: True if test passes, False otherwise
@@ -190,48 +356,39 @@ class TestSeleniumPractice:
         logger.info("=" * 50)
         
         try:
-            self.driver.get(self.base_url)
-            
-            username_input = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='input-username']"))
+            self.wait.until(
+                EC.presence_of_element_located(INPUT_USERNAME)
             )
             
-            password_input = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='input-password']"
-            )
+            # The form fields render together: fetch all four in one round-trip
+            username_input, password_input, username_state, password_state = grab(self.driver, [
+                INPUT_USERNAME, INPUT_PASSWORD, TEXT_USERNAME_STATE, TEXT_PASSWORD_STATE
+            ])
             
             test_username = "selenium_user"
             test_password = "secure_password_123"
             
             username_input.clear()
-            username_input.send_keys(test_username)
+            self._insert_text(test_username, username_input)
             logger.info(f"Entered username: {test_username}")
             
             password_input.clear()
-            password_input.send_keys(test_password)
+            self._insert_text(test_password, password_input)
             logger.info("Entered password")
             
-            username_state = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='text-username-state']"
-            )
             assert test_username in username_state.text
             logger.info(f"State verification: Username state shows '{username_state.text}'")
             
-            password_state = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='text-password-state']"
-            )
             expected_masked = "*" * len(test_password)
             assert expected_masked in password_state.text
             logger.info("State verification: Password state shows masked value")
             
-            login_button = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='button-login']"
-            )
+            login_button = self._find_now(BTN_LOGIN)
             login_button.click()
             logger.info("Clicked login button")
             
             result_element = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='text-login-result']"))
+                EC.presence_of_element_located(TEXT_LOGIN_RESULT)
             )
             assert "successful" in result_element.text.lower()
             logger.info(f"Login result: {result_element.text}")
@@ -239,6 +396,13 @@ class TestSeleniumPractice:
             logger.info("TEST PASSED: State-Controlled Inputs")
             return True
             
+        except AssertionError as e:
+            # Every check reads a field of the login form; crop to its card
+            logger.error(f"TEST FAILED: {str(e)}")
+            self.save_element_screenshot(
+                self._find_now(CARD_STATE_FORM), "test_state_inputs_failed"
+            )
+            return False
         except Exception as e:
             logger.error(f"TEST FAILED: {str(e)}")
             self.save_screenshot("test_state_inputs_failed")
@@ -250,8 +414,7 @@ class TestSeleniumPractice:
         
         This test demonstrates:
         - ActionChains for mouse hover
-        - move_to_element() action
-        - Waiting for dropdown visibility
+        - move_to_element() and pause() in a single chain
         - Clicking dropdown items
         
         Returns:
@@ -262,36 +425,36 @@ class TestSeleniumPractice:
         logger.info("=" * 50)
         
         try:
-            self.driver.get(self.base_url)
-            
             hover_trigger = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='button-hover-trigger']"))
+                EC.presence_of_element_located(BTN_HOVER_TRIGGER)
             )
             
-            actions = ActionChains(self.driver)
-            actions.move_to_element(hover_trigger).perform()
-            logger.info("Performed hover action on trigger button")
-            
-            dropdown_menu = self.wait.until(
-                EC.visibility_of_element_located((By.CSS_SELECTOR, "[data-testid='container-hover-menu']"))
+            # Menu items are always in the DOM (only hidden), so the target
+            # can be located before the hover and driven by a single action
+            # chain. Only the second item is used, so look it up directly
+            # instead of marshalling every menu item back as a WebElement.
+            target_item = self.wait.until(
+                EC.presence_of_element_located(MENU_ITEM_SECOND)
             )
-            logger.info("Dropdown menu is now visible!")
+            logger.info("Found second menu item")
             
-            menu_items = self.driver.find_elements(
-                By.CSS_SELECTOR, "[data-testid^='menu-item-']"
+            # Hover, let the 200ms menu transition finish, then click.
+            # A hidden menu would not take the click, so the selected
+            # item check below also proves the dropdown became visible.
+            (
+                ActionChains(self.driver)
+                .move_to_element(hover_trigger)
+                .pause(0.3)
+                .move_to_element(target_item)
+                .click()
+                .perform()
             )
-            logger.info(f"Found {len(menu_items)} menu items")
+            logger.info("Hovered trigger button and clicked on second menu item")
             
-            if menu_items:
-                target_item = menu_items[1]
-                actions = ActionChains(self.driver)
-                actions.move_to_element(target_item).click().perform()
-                logger.info("Clicked on second menu item")
-                
-                selected_text = self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='text-selected-menu-item']"))
-                )
-                logger.info(f"Selected item confirmed: {selected_text.text}")
+            selected_text = self.wait.until(
+                EC.presence_of_element_located(TEXT_SELECTED_MENU_ITEM)
+            )
+            logger.info(f"Selected item confirmed: {selected_text.text}")
             
             logger.info("TEST PASSED: Hover Dropdown Menu")
             return True
@@ -319,29 +482,34 @@ class TestSeleniumPractice:
         logger.info("=" * 50)
         
         try:
-            self.driver.get(self.base_url)
-            
             simple_alert_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-testid='button-simple-alert']"))
+                EC.element_to_be_clickable(BTN_SIMPLE_ALERT)
             )
             simple_alert_button.click()
             logger.info("Clicked simple alert button")
             
-            alert = self.wait.until(EC.alert_is_present())
+            alert = self.slow_wait.until(EC.alert_is_present())
             alert_text = alert.text
             logger.info(f"Alert appeared with text: {alert_text}")
             alert.accept()
             logger.info("Alert accepted")
             
-            time.sleep(0.5)
-            
-            delete_button = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='button-delete']"
-            )
-            delete_button.click()
+            # accept() is synchronous, so no sleep is needed; if the alert
+            # is somehow still up, accept it again and retry the click.
+            for attempt in range(3):
+                try:
+                    self._find_now(BTN_DELETE).click()
+                    break
+                except UnexpectedAlertPresentException:
+                    if attempt == 2:
+                        raise
+                    try:
+                        self.driver.switch_to.alert.accept()
+                    except NoAlertPresentException:
+                        pass
             logger.info("Clicked delete button (triggers confirm dialog)")
             
-            confirm_alert = self.wait.until(EC.alert_is_present())
+            confirm_alert = self.slow_wait.until(EC.alert_is_present())
             logger.info(f"Confirm dialog appeared: {confirm_alert.text}")
             confirm_alert.dismiss()
             logger.info("Confirm dialog dismissed (cancelled deletion)")
@@ -372,50 +540,57 @@ class TestSeleniumPractice:
         logger.info("=" * 50)
         
         try:
-            self.driver.get(self.base_url)
-            
             scroll_container = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='container-scroll-list']"))
-            )
-            
-            initial_items = self.driver.find_elements(
-                By.CSS_SELECTOR, "[data-testid^='list-item-']"
-            )
-            initial_count = len(initial_items)
+                EC.presence_of_element_located(CONTAINER_SCROLL_LIST)
+            )
+            
+            # One async script scrolls, watches the list with a
+            # MutationObserver and scrolls again after the first batch
+            # arrives, resolving once the item count has grown twice.
+            initial_count, final_count = self.driver.execute_async_script("""
+                var container = arguments[0];
+                var callback = arguments[arguments.length - 1];
+                var selector = "[data-testid^='list-item-']";
+                var count = function () {
+                    return document.querySelectorAll(selector).length;
+                };
+                var initial = count();
+                var last = initial;
+                var loads = 0;
+                var observer = new MutationObserver(function () {
+                    var current = count();
+                    if (current <= last) return;
+                    last = current;
+                    loads += 1;
+                    if (loads >= 2) {
+                        observer.disconnect();
+                        callback([initial, current]);
+                    } else {
+                        container.scrollTop = container.scrollHeight;
+                    }
+                });
+                observer.observe(container, { childList: true, subtree: true });
+                container.scrollTop = container.scrollHeight;
+            """, scroll_container)
             logger.info(f"Initial item count: {initial_count}")
-            
-            self.driver.execute_script(
-                "arguments[0].scrollTop = arguments[0].scrollHeight",
-                scroll_container
-            )
-            logger.info("Scrolled to bottom using execute_script")
-            
-            time.sleep(1)
-            
-            self.driver.execute_script(
-                "arguments[0].scrollTop = arguments[0].scrollHeight",
-                scroll_container
-            )
-            
-            time.sleep(1)
-            
-            final_items = self.driver.find_elements(
-                By.CSS_SELECTOR, "[data-testid^='list-item-']"
-            )
-            final_count = len(final_items)
+            logger.info("Scrolled to bottom twice using execute_async_script")
             logger.info(f"Final item count after scrolling: {final_count}")
             
             assert final_count > initial_count, "No new items loaded after scroll"
             logger.info(f"Successfully loaded {final_count - initial_count} new items")
             
-            item_badge = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='badge-item-count']"
+            item_badge = self.wait.until(
+                EC.presence_of_element_located(BADGE_ITEM_COUNT)
             )
             logger.info(f"Badge shows: {item_badge.text}")
             
             logger.info("TEST PASSED: Infinite Scroll")
             return True
             
+        except AssertionError as e:
+            logger.error(f"TEST FAILED: {str(e)}")
+            self.save_element_screenshot(scroll_container, "test_infinite_scroll_failed")
+            return False
         except Exception as e:
             logger.error(f"TEST FAILED: {str(e)}")
             self.save_screenshot("test_infinite_scroll_failed")
@@ -430,7 +605,7 @@ class TestSeleniumPractice:
         - data-* custom attributes
         - BEM class naming
         - ID selectors
-        - Contains text (via XPath)
+        - Text content (data-testid + textContent, no full-DOM XPath scan)
         - Attribute selectors
         
         Returns:
@@ -441,44 +616,44 @@ class TestSeleniumPractice:
         logger.info("=" * 50)
         
         try:
-            self.driver.get(self.base_url)
-            
-            element = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='selector-element-1']"))
+            self.wait.until(
+                EC.presence_of_element_located(SELECTOR_ELEMENT_1)
             )
             logger.info("1. Found element by data-testid")
             
-            element = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-role='secondary-element']"
-            )
-            logger.info("2. Found element by data-role attribute")
-            
-            elements = self.driver.find_elements(
-                By.CSS_SELECTOR, "[data-category='selector-test']"
-            )
-            logger.info(f"3. Found {len(elements)} elements by data-category")
+            # Presence-only checks: evaluate all strategies in one round-trip
+            results = self.driver.execute_script("""
+                return {
+                    a: !!document.querySelector("[data-testid='selector-element-1']"),
+                    b: !!document.querySelector("[data-role='secondary-element']"),
+                    c: document.querySelectorAll("[data-category='selector-test']").length,
+                    d: !!document.getElementById('unique-element-2'),
+                    e: !!document.querySelector('.selenium-test__element--tertiary'),
+                    f: (document.querySelector("[data-testid='text-page-title']")?.textContent || '')
+                        .includes('Selenium Practice Lab'),
+                    g: !!document.querySelector("[data-contains-text*='specific text']"),
+                    h: !!document.querySelector("button[data-requires-js-click='true']")
+                };
+            """)
+            
+            strategies = [
+                ("a", "data-testid"),
+                ("b", "data-role attribute"),
+                ("d", "ID"),
+                ("e", "BEM class"),
+                ("f", "text content (data-testid + textContent)"),
+                ("g", "partial attribute match"),
+                ("h", "button requiring JS click"),
+            ]
+            missing = [label for key, label in strategies if not results[key]]
+            assert not missing, f"Elements not found by: {', '.join(missing)}"
             
-            element = self.driver.find_element(By.ID, "unique-element-2")
+            logger.info("2. Found element by data-role attribute")
+            logger.info(f"3. Found {results['c']} elements by data-category")
             logger.info("4. Found element by ID")
-            
-            element = self.driver.find_element(
-                By.CSS_SELECTOR, ".selenium-test__element--tertiary"
-            )
             logger.info("5. Found element by BEM class")
-            
-            element = self.driver.find_element(
-                By.XPATH, "//*[contains(text(), 'Selenium Practice Lab')]"
-            )
-            logger.info("6. Found element by text content (XPath)")
-            
-            element = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-contains-text*='specific text']"
-            )
+            logger.info("6. Found element by text content (data-testid + textContent)")
             logger.info("7. Found element by partial attribute match")
-            
-            element = self.driver.find_element(
-                By.CSS_SELECTOR, "button[data-requires-js-click='true']"
-            )
             logger.info("8. Found button requiring JS click")
             
             logger.info("TEST PASSED: CSS Selector Strategies")
@@ -506,10 +681,8 @@ class TestSeleniumPractice:
         logger.info("=" * 50)
         
         try:
-            self.driver.get(self.base_url)
-            
             js_click_button = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='selector-button']"))
+                EC.presence_of_element_located(SELECTOR_BUTTON)
             )
             
             self.driver.execute_script("arguments[0].click();", js_click_button)
@@ -522,9 +695,7 @@ class TestSeleniumPractice:
             """, js_click_button)
             logger.info("Dispatched custom click event via JavaScript")
             
-            username_input = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='input-username']"
-            )
+            username_input = self._find_now(INPUT_USERNAME)
             
             self.driver.execute_script("""
                 var input = arguments[0];
@@ -538,9 +709,7 @@ class TestSeleniumPractice:
             """, username_input)
             logger.info("Triggered React onChange via JavaScript")
             
-            username_state = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-testid='text-username-state']"
-            )
+            username_state = self._find_now(TEXT_USERNAME_STATE)
             if "js_injected_value" in username_state.text:
                 logger.info("Verified: React state updated via JS injection")
             
@@ -557,7 +726,7 @@ class TestSeleniumPractice:
         Test 8: Keyboard Actions
         
         This test demonstrates:
-        - send_keys() with special keys
+        - send_keys() with special keys (text itself via Input.insertText)
         - Enter key submission
         - Tab navigation
         - Key combinations
@@ -570,27 +739,25 @@ class TestSeleniumPractice:
         logger.info("=" * 50)
         
         try:
-            self.driver.get(self.base_url)
-            
             username_input = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='input-username']"))
+                EC.presence_of_element_located(INPUT_USERNAME)
             )
             
-            username_input.send_keys("test_user")
+            self._insert_text("test_user", username_input)
             logger.info("Entered username")
             
             username_input.send_keys(Keys.TAB)
             logger.info("Pressed TAB key to move to password field")
             
             active_element = self.driver.switch_to.active_element
-            active_element.send_keys("test_password")
+            self._insert_text("test_password")
             logger.info("Entered password in active element")
             
             active_element.send_keys(Keys.ENTER)
             logger.info("Pressed ENTER to submit form")
             
             result_element = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='text-login-result']"))
+                EC.presence_of_element_located(TEXT_LOGIN_RESULT)
             )
             logger.info(f"Form submitted, result: {result_element.text}")
             
@@ -630,8 +797,7 @@ class TestSeleniumPractice:
         
         for test_name, test_func in tests:
             try:
-                self.driver.get(self.base_url)
-                time.sleep(0.5)
+                self.setup_method()
                 
                 result = test_func()
                 results[test_name] = "PASSED" if result else "FAILED"
@@ -679,16 +845,26 @@ def main():
     parser.add_argument(
         "--headless",
         action="store_true",
-        help="Run tests in headless mode"
+        help="Run tests in headless mode (default)"
+    )
+    parser.add_argument(
+        "--headed",
+        action="store_true",
+        help="Run tests with a visible browser window"
     )
     
     args = parser.parse_args()
     
+    if args.headed:
+        os.environ["HEADLESS"] = "0"
+    elif args.headless:
+        os.environ["HEADLESS"] = "1"
+    
     TestSeleniumPractice.base_url = args.url
     tests = TestSeleniumPractice()
     
     try:
-        tests.setup_method()
+        TestSeleniumPractice.setup_class()
         results = tests.run_all_tests()
         
         exit_code = 0 if results["failed"] == 0 else 1
@@ -698,7 +874,7 @@ def main():
         exit_code = 1
         
     finally:
-        tests.teardown_method()
+        TestSeleniumPractice.teardown_class()
     
     return exit_code
 